@@ -1,9 +1,12 @@
 from __future__ import annotations
 import ast
+import os
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class MethodInfo:
     class_name: str
     func_name: str
@@ -14,8 +17,23 @@ class MethodInfo:
     is_async: bool
     lineno: int
 
+# Constant types whose repr() matches what ast.unparse would produce
+_SIMPLE_CONSTANTS = (str, int, bool, type(None))
+
+def _fast_unparse(node: ast.AST) -> str:
+    # Student code is mostly `self`, `int`, `None` and small literals; handle those
+    # directly and leave everything else to the (much slower) ast.unparse.
+    t = type(node)
+    if t is ast.Name:
+        return node.id
+    if t is ast.Constant and type(node.value) in _SIMPLE_CONSTANTS and node.kind is None:
+        return repr(node.value)
+    if t is ast.Attribute and type(node.value) in (ast.Name, ast.Attribute):
+        return f"{_fast_unparse(node.value)}.{node.attr}"
+    return ast.unparse(node)
+
 def _u(node: Optional[ast.AST]) -> str:
-    return ast.unparse(node) if node is not None else ""
+    return _fast_unparse(node) if node is not None else ""
 
 def _format_args(a: ast.arguments) -> str:
     parts = []
@@ -76,79 +94,75 @@ def _decorator_strings(node: ast.FunctionDef | ast.AsyncFunctionDef) -> List[str
     return decs
 
 def _has_decorator(node, name: str) -> bool:
-    # Matches "name" and "... .name" cases
+    # Matches "name" and "... .name" cases by looking at the nodes directly, so no
+    # decorator ever needs to be unparsed
     for d in node.decorator_list:
-        text = _u(d)
-        if text == name or text.endswith("." + name):
+        if isinstance(d, ast.Name) and d.id == name:
+            return True
+        if isinstance(d, ast.Attribute) and d.attr == name:
             return True
     return False
 
-class _MethodCollector(ast.NodeVisitor):
-    def __init__(
-        self,
-        class_filter: Optional[Set[str]] = None,
-        include_dunder: bool = False,
-        include_private: bool = True,
-    ):
-        self.class_filter = class_filter
-        self.include_dunder = include_dunder
-        self.include_private = include_private
-        self.methods: List[MethodInfo] = []
-        self._class_stack: List[str] = []
-        self._def_depth: int = 0
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        self._class_stack.append(node.name)
-        self.generic_visit(node)
-        self._class_stack.pop()
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        self._handle_func(node, is_async=False)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        self._handle_func(node, is_async=True)
-
-    def _handle_func(self, node, is_async: bool):
-        # We only want methods that are direct children of a class, not nested inside another def.
-        direct_method = bool(self._class_stack) and self._def_depth == 0
-        self._def_depth += 1
-        try:
-            if not direct_method:
-                self.generic_visit(node)
-                return
-
-            cls = self._class_stack[-1]
-            if self.class_filter and cls not in self.class_filter:
-                return
-
-            name = node.name
-            if name.startswith("__") and name.endswith("__") and not self.include_dunder:
-                return
-            if name.startswith("_") and not self.include_private and not (name.startswith("__") and name.endswith("__")):
-                return
-
-            sig = _format_args(node.args)
-            header = ("async def " if is_async else "def ") + f"{name}({sig})"
-            if node.returns:
-                header += f" -> {_u(node.returns)}"
-            header += ":"
-
-            decs = _decorator_strings(node)
-            info = MethodInfo(
-                class_name=cls,
-                func_name=name,
-                header=header,
-                decorators=decs,
-                is_classmethod=_has_decorator(node, "classmethod"),
-                is_staticmethod=_has_decorator(node, "staticmethod"),
-                is_async=is_async,
-                lineno=node.lineno,
-            )
-            self.methods.append(info)
-        finally:
-            self._def_depth -= 1
-            # Still visit children so nested defs are traversed (but not recorded as methods)
-            self.generic_visit(node)
+def _method_info(node, cls: str, is_async: bool) -> MethodInfo:
+    sig = _format_args(node.args)
+    header = ("async def " if is_async else "def ") + f"{node.name}({sig})"
+    if node.returns:
+        header += f" -> {_u(node.returns)}"
+    header += ":"
+    # interned so comparisons against (interned) required-header literals hit the
+    # identity fast path
+    header = sys.intern(header)
+
+    return MethodInfo(
+        class_name=cls,
+        func_name=node.name,
+        header=header,
+        decorators=_decorator_strings(node),
+        is_classmethod=_has_decorator(node, "classmethod"),
+        is_staticmethod=_has_decorator(node, "staticmethod"),
+        is_async=is_async,
+        lineno=node.lineno,
+    )
+
+def _collect_class(
+    node: ast.ClassDef,
+    methods: List[MethodInfo],
+    class_filter: Optional[Set[str]],
+    include_dunder: bool,
+    include_private: bool,
+) -> None:
+    # Only direct children of the class body are methods; method bodies are never
+    # descended into, so nested defs are not reported. Nested classes are.
+    cls = node.name
+    wanted = not class_filter or cls in class_filter
+    for child in node.body:
+        t = type(child)
+        if t is ast.ClassDef:
+            _collect_class(child, methods, class_filter, include_dunder, include_private)
+            continue
+        if not wanted or (t is not ast.FunctionDef and t is not ast.AsyncFunctionDef):
+            continue
+
+        name = child.name
+        if name.startswith("__") and name.endswith("__") and not include_dunder:
+            continue
+        if name.startswith("_") and not include_private and not (name.startswith("__") and name.endswith("__")):
+            continue
+        methods.append(_method_info(child, cls, t is ast.AsyncFunctionDef))
+
+def _collect_methods(
+    tree: ast.Module,
+    class_filter: Optional[Set[str]] = None,
+    include_dunder: bool = False,
+    include_private: bool = True,
+) -> List[MethodInfo]:
+    # Plain loops over the top-level statements; an ast.NodeVisitor would dispatch
+    # through getattr() for every node in the file.
+    methods: List[MethodInfo] = []
+    for stmt in tree.body:
+        if type(stmt) is ast.ClassDef:
+            _collect_class(stmt, methods, class_filter, include_dunder, include_private)
+    return methods
 
 def extract_method_headers_from_source(
     source: str,
@@ -158,21 +172,47 @@ def extract_method_headers_from_source(
     include_private: bool = True,
 ) -> List[MethodInfo]:
     tree = ast.parse(source)
-    collector = _MethodCollector(class_filter, include_dunder, include_private)
-    collector.visit(tree)
-    return collector.methods
+    return _collect_methods(tree, class_filter, include_dunder, include_private)
+
+# Parsed trees keyed by absolute path -> (mtime_ns, size, tree), least recently used first.
+# Graders call extract_method_headers_from_file("main.py") once per test, so the same
+# unchanged source would otherwise be re-read and re-parsed for every test.
+_AST_CACHE_MAXSIZE = 32
+_ast_cache: OrderedDict[str, Tuple[int, int, ast.Module]] = OrderedDict()
+
+def _parse_file_cached(path: str) -> ast.Module:
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    hit = _ast_cache.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _ast_cache.move_to_end(key)
+        return hit[2]
+
+    with open(path, "rb") as f:
+        src = f.read()
+    # src is raw bytes: ast.parse decodes it in C (honouring any coding cookie), and
+    # filename= makes syntax errors point at the student file
+    tree = ast.parse(src, filename=path, type_comments=False)
+    _ast_cache[key] = (st.st_mtime_ns, st.st_size, tree)
+    _ast_cache.move_to_end(key)
+    if len(_ast_cache) > _AST_CACHE_MAXSIZE:
+        _ast_cache.popitem(last=False)
+    return tree
 
 def extract_method_headers_from_file(
     path: str,
-    **kwargs,
+    *,
+    class_filter: Optional[Set[str]] = None,
+    include_dunder: bool = False,
+    include_private: bool = True,
 ) -> List[MethodInfo]:
-    with open(path, "r", encoding="utf-8") as f:
-        src = f.read()
-    return extract_method_headers_from_source(src, **kwargs)
+    tree = _parse_file_cached(path)
+    return _collect_methods(tree, class_filter, include_dunder, include_private)
 
 if __name__ == "__main__":
 # Suppose student_main.py defines class ZigZagBot with several methods.
     class_to_check = {"HarvesterBot"}
+    required_headers = frozenset(map(sys.intern, ('def turnRight(self):', 'def harvestBeeperField(self):')))
     methods = extract_method_headers_from_file(
         "main.py",
         class_filter= class_to_check,   # or None for all classes
@@ -187,7 +227,7 @@ if __name__ == "__main__":
         # for d in m.decorators:
         #     print(d)
         checkmark = ""
-        if m.header in('def turnRight(self):', 'def harvestBeeperField(self):'):
+        if m.header in required_headers:
             checkmark = " ✅"
         else:
             checkmark =""
@@ -0,0 +1,49 @@
+""" Tests for the parse cache behind extract_method_headers_from_file. """
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from karel import code_parser
+from karel.code_parser import extract_method_headers_from_file
+
+SOURCE = (
+    "class HarvesterBot:\n"
+    "    def turnRight(self):\n"
+    "        pass\n"
+)
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "main.py")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(SOURCE)
+        code_parser._ast_cache.clear()
+
+    def tearDown(self):
+        code_parser._ast_cache.clear()
+        shutil.rmtree(self.dir)
+
+    def testCacheHitDoesNotReadFile(self):
+        "an unchanged file is only stat'ed, never reopened"
+        first = extract_method_headers_from_file(self.path)
+        with mock.patch("builtins.open", side_effect=AssertionError("file was read")):
+            second = extract_method_headers_from_file(self.path)
+        self.assertEqual(first, second)
+
+    def testChangedFileIsReparsed(self):
+        "a new mtime or size misses the cache"
+        extract_method_headers_from_file(self.path)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("    def harvest(self):\n        pass\n")
+        headers = [m.header for m in extract_method_headers_from_file(self.path)]
+        self.assertEqual(headers, ["def turnRight(self):", "def harvest(self):"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """
 Useful functions and constants for getting info from robots esp. for writing tests.
 """
+from operator import attrgetter
 from karel.robota import East, West, North, South, UrRobot, Robot
 from karel.robotworld import RobotWorld
 
@@ -11,20 +12,28 @@ direction_strings = {
     South: 'South'
 }
 
+# attrgetter does the (name-mangled) private attribute lookups in C
+_get_street = attrgetter("_UrRobot__street")
+_get_avenue = attrgetter("_UrRobot__avenue")
+_get_location = attrgetter("_UrRobot__street", "_UrRobot__avenue")
+_get_direction = attrgetter("_UrRobot__direction")
+_get_beepers = attrgetter("_UrRobot__beepers")
+_get_status = attrgetter("_UrRobot__street", "_UrRobot__avenue", "_UrRobot__direction", "_UrRobot__beepers")
+
 def getStreet(robot):
-    return robot._UrRobot__street
+    return _get_street(robot)
 
 def getAvenue(robot):
-    return robot._UrRobot__avenue
+    return _get_avenue(robot)
 
 def getLocation(robot):
-    return (robot._UrRobot__street, robot._UrRobot__avenue)
+    return _get_location(robot)
 
 def getDirection(robot):
-    return robot._UrRobot__direction
+    return _get_direction(robot)
 
 def getDirectionStr(robot):
-    return direction_strings[robot._UrRobot__direction]
+    return direction_strings[_get_direction(robot)]
 
 def _status_to_str(status):
     return (status[0], 
@@ -33,7 +42,7 @@ def _status_to_str(status):
             status[3])
 
 def getBeepers(robot):
-    return robot._UrRobot__beepers
+    return _get_beepers(robot)
 
 def getActionCount(robot):
     return robot._UrRobot__action_count
@@ -42,55 +51,62 @@ def getLocationList(robot):
     return robot._UrRobot__location_list
 
 def getStatus(robot):
-    return (robot._UrRobot__street, 
-            robot._UrRobot__avenue,
-            robot._UrRobot__direction,
-            robot._UrRobot__beepers)
+    return _get_status(robot)
 
 def getStatusStr(robot):
      return _status_to_str(getStatus(robot))
 
 
-def robotEquals(robot_or_tuple_A, robot_or_tuple_B, ignoreBeepers=False, atLeastBeepers=False, ignoreDirection=False):
+def statusEquals(tuple_A, tuple_B, ignoreBeepers=False, atLeastBeepers=False, ignoreDirection=False):
     """
-    Compares the status of a robot or a status tuple to another status tuple.
+    Compares two status tuples (street, avenue, direction, beepers).
+
+    Same comparison as robotEquals, for callers that already hold status tuples.
 
-    :param robot_or_tuple_A: Either a robot object or a status tuple (street, avenue, direction, beepers).
-    :param robot_or_tuple_B: Either a robot object or a status tuple (street, avenue, direction, beepers) to compare against.
     :param ignoreBeepers: defaults to False. If True, ignores the beeper count during the comparison.
-    :param atLeastBeepers: defaults to False. If True, returns true if robot_A has at least as many beepers as robot_B(ignoreBeepers overrides this)
+    :param atLeastBeepers: defaults to False. If True, returns true if tuple_A has at least as many beepers as tuple_B(ignoreBeepers overrides this)
     :return: True if the statuses match (considering beepers if not ignored), otherwise False.
     """
-    # Check if the first parameter is a robot, and convert to a status tuple if so
-    if isinstance(robot_or_tuple_A, UrRobot):
-        robot_A = getStatus(robot_or_tuple_A)  # Convert robot to a status tuple using utility function
-    else:
-        robot_A = robot_or_tuple_A  # Assume obj is already a tuple
+    # Common case (no flags): one comparison of the four status fields. Slicing and
+    # tuple() let lists and longer sequences compare like the field-by-field check
+    if not (ignoreBeepers or atLeastBeepers or ignoreDirection):
+        return tuple(tuple_A[:4]) == tuple(tuple_B[:4])
 
-    if isinstance(robot_or_tuple_B, UrRobot):
-        robot_B = getStatus(robot_or_tuple_B)  # Convert robot to a status tuple using utility function
-    else:
-        robot_B= robot_or_tuple_B  # Assume obj is already a tuple
-    
     # Perform the location and direction comparison
-    result = (robot_A[0] == robot_B[0] and  # Compare street
-              robot_A[1] == robot_B[1] and  # Compare avenue
-              (ignoreDirection or robot_A[2] == robot_B[2])  # Compare direction or ignore
-              )    
-
+    result = (tuple_A[0] == tuple_B[0] and  # Compare street
+              tuple_A[1] == tuple_B[1] and  # Compare avenue
+              (ignoreDirection or tuple_A[2] == tuple_B[2])  # Compare direction or ignore
+              )
 
     # Handle beeper comparison based on flags
     if not ignoreBeepers:  # If beepers are not ignored
         if atLeastBeepers:
-            # Check if robot_A has at least as many beepers as robot_B
-            result = result and (robot_A[3] >= robot_B[3])
+            # Check if tuple_A has at least as many beepers as tuple_B
+            result = result and (tuple_A[3] >= tuple_B[3])
         else:
             # Check if beeper counts are exactly equal
-            result = result and (robot_A[3] == robot_B[3])
-
+            result = result and (tuple_A[3] == tuple_B[3])
 
     return result
 
+
+def robotEquals(robot_or_tuple_A, robot_or_tuple_B, ignoreBeepers=False, atLeastBeepers=False, ignoreDirection=False):
+    """
+    Compares the status of a robot or a status tuple to another status tuple.
+
+    :param robot_or_tuple_A: Either a robot object or a status tuple (street, avenue, direction, beepers).
+    :param robot_or_tuple_B: Either a robot object or a status tuple (street, avenue, direction, beepers) to compare against.
+    :param ignoreBeepers: defaults to False. If True, ignores the beeper count during the comparison.
+    :param atLeastBeepers: defaults to False. If True, returns true if robot_A has at least as many beepers as robot_B(ignoreBeepers overrides this)
+    :return: True if the statuses match (considering beepers if not ignored), otherwise False.
+    """
+    # Convert robots to status tuples; tuples pass through unchanged
+    if isinstance(robot_or_tuple_A, UrRobot):
+        robot_or_tuple_A = getStatus(robot_or_tuple_A)
+    if isinstance(robot_or_tuple_B, UrRobot):
+        robot_or_tuple_B = getStatus(robot_or_tuple_B)
+    return statusEquals(robot_or_tuple_A, robot_or_tuple_B, ignoreBeepers, atLeastBeepers, ignoreDirection)
+
 def get_world_diffs(robot_world, expected_world):
     """
     Compares the beeper state of two robot worlds.
@@ -127,6 +143,14 @@ def get_world_diffs_from_file(robot_world, expected_world_file):
     # Use the world comparison function
     return get_world_diffs(robot_world, expected_world)
     
+# Row layouts for get_beeper_diffs; {world}/{expected} are _DIFF_CELL_FORMAT cells
+_DIFF_CELL_FORMAT = "{:<3} {:<3} {:<5}"
+_DIFF_ROW_FORMATS = {
+    "MISSING":  "MISSING | _   _   _     | {expected:<14}",
+    "EXTRA":    "EXTRA   | {world:<14}| --  --  --    ",
+    "MISMATCH": "MISMATCH| {world:<14}| {expected:<14}",
+}
+
 def get_beeper_diffs(world_beepers, expected_beepers):
     """
     Compares beepers in the current world state with those described in another world.
@@ -140,12 +164,7 @@ def get_beeper_diffs(world_beepers, expected_beepers):
             - 'diffs': True if differences exist, False otherwise.
             - 'allbeeperdiffs': A multiline string showing the side-by-side comparison.
     """
-    differences_found = False
-    num_beepers_correct = 0
     comparison_lines = []
-    total_expected_beeper_count = 0
-    total_actual_beeper_count = 0
-    correct_matches = 0
 
     # Add column headings
     header = (
@@ -156,48 +175,46 @@ def get_beeper_diffs(world_beepers, expected_beepers):
     comparison_lines.append(header)
     comparison_lines.append(separator)
 
-    # Gather all unique positions from both dictionaries
-    all_positions = set(world_beepers.keys()) | set(expected_beepers.keys())
-
-    for position in sorted(all_positions):
-        robot_count = world_beepers.get(position, None)  #robot_count is a misnomer here.  Shuld be world_count
-        expected_count = expected_beepers.get(position, None)
-
-        total_expected_beeper_count += expected_count or 0
-        total_actual_beeper_count += robot_count or 0
-        
-        if robot_count is None and expected_count > 0:  # Missing in robot world
-            differences_found = True
-            comparison_lines.append(
-                f"{'MISSING'.ljust(8)}| {'_   _   _':<14}| "
-                f"{f'{position[0]:<3} {position[1]:<3} {expected_count:<5}':<14}"
-            )
-        elif expected_count is None and robot_count > 0:  # Extra in robot world
-            differences_found = True
-            comparison_lines.append(
-                f"{'EXTRA'.ljust(8)}| "
-                f"{f'{position[0]:<3} {position[1]:<3} {robot_count:<5}':<14}| {'--  --  --':<14}"
-            )
-        elif robot_count != None and expected_count != None and robot_count != expected_count:  # Mismatched counts
-            differences_found = True
-            robot_count = str(robot_count)+"<<"
-            comparison_lines.append(
-                f"{'MISMATCH'.ljust(8)}| "
-                f"{f'{position[0]:<3} {position[1]:<3} {robot_count:<5}':<14}| "
-                f"{f'{position[0]:<3} {position[1]:<3} {expected_count:<5}':<14}"
-            )
-        elif robot_count != None and expected_count != None:  # Matches correctly
+    # Split positions into only-expected / only-in-world / in-both, so each group needs
+    # no None checks. Diff rows are collected as (position, kind, world, expected) tuples
+    # and formatted with the fixed-width templates above once they are sorted.
+    world_positions = world_beepers.keys()
+    expected_positions = expected_beepers.keys()
+    diff_rows = []
+
+    for position in expected_positions - world_positions:  # Missing in robot world
+        expected_count = expected_beepers[position]
+        if expected_count > 0:
+            diff_rows.append((position, "MISSING", None, expected_count))
+
+    for position in world_positions - expected_positions:  # Extra in robot world
+        world_count = world_beepers[position]
+        if world_count > 0:
+            diff_rows.append((position, "EXTRA", world_count, None))
+
+    common_positions = world_positions & expected_positions
+    correct_matches = 0
+    for position in common_positions:  # Mismatched counts
+        world_count = world_beepers[position]
+        expected_count = expected_beepers[position]
+        if world_count == expected_count:  # Matches correctly
             correct_matches += 1
-        #     comparison_lines.append(
-        #         f"{'   -'.ljust(8)}| "
-        #         f"{f'{position[0]:<3} {position[1]:<3} {robot_count:<5}':<14}| "
-        #         f"{f'{position[0]:<3} {position[1]:<3} {expected_count:<5}':<14}"
-        #     )
+        else:
+            diff_rows.append((position, "MISMATCH", str(world_count)+"<<", expected_count))
+
+    diff_rows.sort()
+    for position, kind, world_count, expected_count in diff_rows:
+        cells = {}
+        if world_count is not None:
+            cells['world'] = _DIFF_CELL_FORMAT.format(position[0], position[1], world_count)
+        if expected_count is not None:
+            cells['expected'] = _DIFF_CELL_FORMAT.format(position[0], position[1], expected_count)
+        comparison_lines.append(_DIFF_ROW_FORMATS[kind].format_map(cells))
 
     return {
-        'diffs': differences_found,
-        'num_beepers_in_world': total_actual_beeper_count,
-        'num_beepers_expected': total_expected_beeper_count,
+        'diffs': len(diff_rows) > 0,
+        'num_beepers_in_world': sum(world_beepers.values()),
+        'num_beepers_expected': sum(expected_beepers.values()),
         'allbeeperdiffs': "\n".join(comparison_lines),
         'correct_matches': correct_matches
     }
@@ -0,0 +1,35 @@
+""" Tests for the status comparisons in robotutils and kareltestutils. """
+
+import unittest
+
+from karel.robota import North, East
+import karel.robotutils as util
+from karel.kareltestutils import testRobotEquals
+
+
+class StatusEqualsTest(unittest.TestCase):
+
+    def testListMatchesTuple(self):
+        "a status given as a list equals the same status as a tuple"
+        self.assertTrue(util.statusEquals([3, 4, North, 2], (3, 4, North, 2)))
+        self.assertTrue(util.statusEquals((3, 4, North, 2), [3, 4, North, 2]))
+        self.assertFalse(util.statusEquals([3, 4, North, 2], (3, 4, East, 2)))
+
+    def testOnlyFirstFourFieldsCompared(self):
+        "anything after street, avenue, direction and beepers is ignored"
+        self.assertTrue(util.statusEquals((3, 4, North, 2, "extra"), (3, 4, North, 2)))
+
+    def testFlagsStillApply(self):
+        self.assertTrue(util.statusEquals([3, 4, North, 5], (3, 4, North, 2), atLeastBeepers=True))
+        self.assertTrue(util.statusEquals([3, 4, East, 0], (3, 4, North, 2),
+                                          ignoreBeepers=True, ignoreDirection=True))
+
+    def testRobotEqualsWithList(self):
+        self.assertTrue(util.robotEquals([3, 4, North, 2], (3, 4, North, 2)))
+
+    def testTestRobotEqualsWithList(self):
+        self.assertTrue(testRobotEquals("list status", [3, 4, North, 2], (3, 4, North, 2), verbose=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+"""
+Runs student code in a separate Python process for the graders.
+
+Importing main.py and driving its robots inside the grader means a crash, segfault or
+sys.exit() in student code takes the whole grader down with it. A StudentWorker starts
+one child interpreter (reused by every test, so startup is paid once) and talks to it
+with length-prefixed pickled messages over the child's stdin/stdout:
+
+    worker = StudentWorker()
+    worker.setup_world("BeeperField.kwld")
+    worker.check_class("main", "HarvesterBot")
+    bot = worker.new_robot("main", "HarvesterBot", 2, 2, North, 0)
+    worker.call(bot, "turnRight")
+    status = worker.get_status(bot)    # (street, avenue, direction, beepers)
+
+Anything the student code prints is captured in the child and echoed by the grader.
+Errors raised by student code, and the child dying, both surface as StudentWorkerError.
+"""
+import importlib
+import io
+import os
+import pickle
+import struct
+import subprocess
+import sys
+from contextlib import redirect_stdout
+
+_HEADER = struct.Struct(">I")  # 4-byte big-endian message length
+
+
+class StudentWorkerError(Exception):
+    """Student code raised an error, or the worker process died."""
+
+
+def _send(stream, message):
+    data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def _recv(stream):
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise EOFError("worker channel closed")
+    (size,) = _HEADER.unpack(header)
+    data = stream.read(size)
+    if len(data) < size:
+        raise EOFError("worker channel closed")
+    return pickle.loads(data)
+
+
+class StudentWorker:
+    """Grader-side handle on a child interpreter that runs student code."""
+
+    def __init__(self, cwd=None):
+        # make sure the child can import karel no matter how the grader found it
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (package_root, env.get("PYTHONPATH")) if p)
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "karel.student_worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+        )
+
+    @property
+    def alive(self):
+        return self.proc.poll() is None
+
+    def request(self, *message):
+        """Send one message to the worker and return its result."""
+        try:
+            _send(self.proc.stdin, message)
+            status, value, output = _recv(self.proc.stdout)
+        except (EOFError, OSError):
+            code = self.proc.wait()
+            raise StudentWorkerError(f"Student code crashed the test process (exit code {code}).") from None
+
+        if output:
+            print(output, end="")
+        if status == "error":
+            raise StudentWorkerError(value)
+        return value
+
+    def setup_world(self, world_file):
+        """Load world_file into a fresh, non-graphical world."""
+        return self.request("setup_world", world_file)
+
+    def check_class(self, module_name, class_name):
+        """Import module_name and make sure it defines class_name."""
+        return self.request("check_class", module_name, class_name)
+
+    def method_exists(self, module_name, class_name, method_name):
+        """Run testClassMethodExists on the student's class; returns its result."""
+        return self.request("method_exists", module_name, class_name, method_name)
+
+    def new_robot(self, module_name, class_name, *args):
+        """Construct a robot in the worker and return an id for it."""
+        return self.request("new_robot", module_name, class_name, args)
+
+    def call(self, robot_id, method_name, *args):
+        return self.request("call", robot_id, method_name, args)
+
+    def get_status(self, robot_id):
+        return self.request("get_status", robot_id)
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass  # the worker already died with a request half-written
+        self.proc.wait()
+        self.proc.stdout.close()
+
+
+# ---------- worker (child process) side ----------
+
+_robots = {}
+
+
+def _get_class(module_name, class_name):
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _setup_world(world_file):
+    from karel.robota import UrRobot
+    world = UrRobot.use_graphics(False)
+    world.setTrace(False)
+    world.readWorld(world_file)
+
+
+def _check_class(module_name, class_name):
+    _get_class(module_name, class_name)
+
+
+def _method_exists(module_name, class_name, method_name):
+    from karel.kareltestutils import testClassMethodExists
+    return testClassMethodExists(_get_class(module_name, class_name), method_name)
+
+
+def _new_robot(module_name, class_name, args):
+    robot_id = len(_robots)
+    _robots[robot_id] = _get_class(module_name, class_name)(*args)
+    return robot_id
+
+
+def _call(robot_id, method_name, args):
+    return getattr(_robots[robot_id], method_name)(*args)
+
+
+def _get_status(robot_id):
+    import karel.robotutils as util
+    return util.getStatus(_robots[robot_id])
+
+
+_handlers = {
+    "setup_world": _setup_world,
+    "check_class": _check_class,
+    "method_exists": _method_exists,
+    "new_robot": _new_robot,
+    "call": _call,
+    "get_status": _get_status,
+}
+
+
+def _serve():
+    # Keep the real stdout for replies and point fd 1 at stderr, so nothing the student
+    # writes (even from C code) can corrupt the message stream.
+    requests = sys.stdin.buffer
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    while True:
+        try:
+            command, *args = _recv(requests)
+        except EOFError:
+            return
+
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                value = _handlers[command](*args)
+            reply = ("ok", value, buf.getvalue())
+        except BaseException as e:  # includes SystemExit from student code
+            reply = ("error", f"{type(e).__name__}: {e}", buf.getvalue())
+        try:
+            _send(replies, reply)
+        except Exception as e:  # result could not be pickled; nothing was written yet
+            _send(replies, ("error", f"{type(e).__name__}: {e}", buf.getvalue()))
+
+
+if __name__ == "__main__":
+    _serve()
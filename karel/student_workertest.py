@@ -0,0 +1,136 @@
+""" Tests for StudentWorker, the subprocess the graders run student code in. """
+
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from karel.robota import North, South
+from karel import Test1
+from karel.student_worker import StudentWorker, StudentWorkerError
+
+STUDENT_SOURCE = '''
+import os, sys
+from karel.robota import UrRobot
+
+class TestBot(UrRobot):
+    def turnRight(self):
+        for _ in range(3):
+            self.turnLeft()
+
+    def shout(self):
+        print("hello from the student")
+        os.write(1, b"written straight to fd 1\\n")
+        return 7
+
+    def quit(self):
+        sys.exit(3)
+
+    def die(self):
+        os._exit(5)
+'''
+
+WORLD = "KarelWorld\nstreets 10\navenues 10\nbeepers 3 3 1\n"
+
+
+class StudentWorkerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        with open(os.path.join(self.dir, "student.py"), "w") as f:
+            f.write(STUDENT_SOURCE)
+        with open(os.path.join(self.dir, "test.kwld"), "w") as f:
+            f.write(WORLD)
+        self.worker = StudentWorker(cwd=self.dir)
+        self.worker.setup_world("test.kwld")
+
+    def tearDown(self):
+        self.worker.close()
+        shutil.rmtree(self.dir)
+
+    def request(self, method, *args):
+        "run one worker request and return (result, what it echoed)"
+        out = StringIO()
+        with redirect_stdout(out):
+            result = method(*args)
+        return result, out.getvalue()
+
+    def testRoundTrip(self):
+        "setup_world, new_robot, call and get_status all reach the child and come back"
+        self.worker.check_class("student", "TestBot")
+        bot = self.worker.new_robot("student", "TestBot", 2, 2, North, 0)
+        self.assertEqual(self.worker.get_status(bot), (2, 2, North, 0))
+        self.worker.call(bot, "turnRight")
+        self.worker.call(bot, "turnRight")
+        self.assertEqual(self.worker.get_status(bot), (2, 2, South, 0))
+
+    def testMissingClass(self):
+        self.assertRaises(StudentWorkerError, self.worker.check_class, "student", "NoSuchBot")
+        self.assertTrue(self.worker.alive)
+
+    def testStudentSysExit(self):
+        "sys.exit() in student code fails the call but leaves the worker running"
+        bot = self.worker.new_robot("student", "TestBot", 1, 1, North, 0)
+        with self.assertRaises(StudentWorkerError) as cm:
+            self.worker.call(bot, "quit")
+        self.assertIn("SystemExit", str(cm.exception))
+        self.assertTrue(self.worker.alive)
+        self.assertEqual(self.worker.get_status(bot), (1, 1, North, 0))
+
+    def testStudentOsExit(self):
+        "os._exit() kills the worker; the call fails instead of hanging"
+        bot = self.worker.new_robot("student", "TestBot", 1, 1, North, 0)
+        with self.assertRaises(StudentWorkerError) as cm:
+            self.worker.call(bot, "die")
+        self.assertIn("exit code 5", str(cm.exception))
+        self.assertFalse(self.worker.alive)
+        self.assertRaises(StudentWorkerError, self.worker.get_status, bot)
+
+    def testStudentOutputKeepsFraming(self):
+        "print() is echoed by the grader, and raw writes to fd 1 don't corrupt replies"
+        bot = self.worker.new_robot("student", "TestBot", 1, 1, North, 0)
+        result, echoed = self.request(self.worker.call, bot, "shout")
+        self.assertEqual(result, 7)
+        self.assertEqual(echoed, "hello from the student\n")
+        self.assertEqual(self.worker.get_status(bot), (1, 1, North, 0))
+
+
+class WorkerRestartTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        with open(os.path.join(self.dir, "student.py"), "w") as f:
+            f.write(STUDENT_SOURCE)
+        with open(os.path.join(self.dir, "test.kwld"), "w") as f:
+            f.write(WORLD)
+        self.old_cwd = os.getcwd()
+        os.chdir(self.dir)
+        Test1._worker = None
+
+    def tearDown(self):
+        if Test1._worker is not None:
+            Test1._worker.close()
+            Test1._worker = None
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.dir)
+
+    def testCrashedWorkerIsReplaced(self):
+        "get_worker starts a fresh worker once the old one has died"
+        worker = Test1.get_worker()
+        self.assertIs(Test1.get_worker(), worker)
+        worker.setup_world("test.kwld")
+        bot = worker.new_robot("student", "TestBot", 1, 1, North, 0)
+        self.assertRaises(StudentWorkerError, worker.call, bot, "die")
+
+        fresh = Test1.get_worker()
+        self.assertIsNot(fresh, worker)
+        self.assertTrue(fresh.alive)
+        fresh.setup_world("test.kwld")
+        bot = fresh.new_robot("student", "TestBot", 4, 4, North, 0)
+        self.assertEqual(fresh.get_status(bot), (4, 4, North, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
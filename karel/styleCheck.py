@@ -1,37 +1,85 @@
-import ast
-import re
+import tokenize
 
+# tokens that carry no code; skipped when looking for the end of a statement
+_NON_CODE = (tokenize.NL, tokenize.COMMENT)
 
-def extract_comments(file_path):
-    """Extracts all comments (inline `#` and triple-quoted comments) from a Python file."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        source_code = f.read()
 
-    # Extract inline comments using regex (ignores # inside strings)
-    inline_comments = re.findall(r"(?<!['\"])\s+#(.*)", source_code)
+def _string_text(literal):
+    """Text between the quotes of a string token, or None for bytes and f-strings."""
+    body = literal.lstrip("rRuUbBfF")
+    if any(c in "bBfF" for c in literal[:len(literal) - len(body)]):
+        return None
+    quote = body[:3] if body[:3] in ('"""', "'''") else body[0]
+    return body[len(quote):-len(quote)]
 
-    # Parse the code into an AST
-    tree = ast.parse(source_code, filename=file_path)
+
+def _classify_comments(tokens):
+    """
+    Sort a file's tokens into (inline comments, docstrings, standalone comments).
+    unit_tests/unittestutils.py keeps an identical copy, so both graders count the
+    same comments; karel/styleChecktest.py checks that they agree.
+    """
+    inline_comments = []
     docstrings = []
     standalone_comments = []
 
-    # Extract standalone triple-quoted comments (not attached to functions/classes)
-    triple_quoted_comments = re.findall(r'("""|\'\'\')(.*?)\1', source_code, re.DOTALL)
-    all_triple_quoted = [comment[1].strip() for comment in triple_quoted_comments]
+    # One pass over the tokens. A string that makes up a whole statement is a docstring
+    # when it is the first statement of a def/class body, otherwise a standalone comment.
+    stmt_start = True      # next code token begins a statement
+    in_header = False      # inside a def/class line, before its ':'
+    expect_doc = False     # next statement is the first one in a def/class body
+    depth = 0              # bracket nesting, so ':' inside (...) isn't the header's colon
+    for i, tok in enumerate(tokens):
+        if tok.type == tokenize.COMMENT:
+            inline_comments.append(tok.string[1:])
+            continue
+        if tok.type in (tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT):
+            stmt_start = True
+            continue
+        if tok.type in (tokenize.NL, tokenize.ENCODING, tokenize.ENDMARKER):
+            continue
+
+        if stmt_start:
+            stmt_start = False
+            if tok.type == tokenize.NAME and tok.string in ("def", "class"):
+                in_header = True
+            elif tok.type == tokenize.STRING:
+                # the string is a whole statement if the next code token ends it
+                j = i + 1
+                while tokens[j].type in _NON_CODE:  # ENDMARKER always stops the scan
+                    j += 1
+                text = _string_text(tok.string)
+                if text is not None and (tokens[j].type in (tokenize.NEWLINE, tokenize.ENDMARKER)
+                                         or tokens[j].string == ";"):
+                    if expect_doc:
+                        if text.strip():
+                            docstrings.append(text)
+                    elif tok.string.lstrip("rRuU")[:3] in ('"""', "'''"):
+                        # only block strings count as comments, not stray 'x' statements
+                        standalone_comments.append(text.strip())
+            if not in_header:
+                expect_doc = False
+
+        if tok.type == tokenize.OP:
+            if tok.string in "([{":
+                depth += 1
+            elif tok.string in ")]}":
+                depth -= 1
+            elif tok.string == ";":
+                stmt_start = True
+            elif tok.string == ":" and in_header and depth == 0:
+                # a one-line body may follow on the same line
+                in_header = False
+                expect_doc = True
+                stmt_start = True
 
-    # Walk through AST to extract docstrings (only for classes and functions)
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-            # Extract function/class docstrings if present
-            if ast.get_docstring(node):
-                docstrings.append(ast.get_docstring(node, clean=False))
+    return inline_comments, docstrings, standalone_comments
 
-    # Anything in all_triple_quoted that wasn't captured as a function/class docstring is standalone
-    for comment in all_triple_quoted:
-        if comment not in docstrings:
-            standalone_comments.append(comment)
 
-    return inline_comments, docstrings, standalone_comments
+def extract_comments(file_path):
+    """Extracts all comments (inline `#` and triple-quoted comments) from a Python file."""
+    with open(file_path, "rb") as f:
+        return _classify_comments(list(tokenize.tokenize(f.readline)))
 
 def test_passed(test_feedback):
     
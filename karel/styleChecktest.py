@@ -0,0 +1,90 @@
+""" Tests that styleCheck and unit_tests/unittestutils classify comments the same way. """
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from karel import styleCheck
+from unit_tests import unittestutils
+
+SOURCES = {
+    "header": '''"""
+Your Name
+NetId
+Date
+"""
+from karel.robota import *
+
+class HarvesterBot(UrRobot):
+    """Harvests a field of beepers."""
+
+    def turnRight(self):  # three lefts make a right
+        """Turn 90 degrees clockwise."""
+        for _ in range(3):
+            self.turnLeft()
+''',
+    "assigned strings": '''x = """not a comment, it's assigned"""
+print("""also not a comment""")
+y = "# not a comment either"
+"""a standalone comment"""
+''',
+    "quote styles": """def f():
+    'single-quoted docstring'
+    '''a standalone comment inside f'''
+
+def g(): \"\"\"one-line body docstring\"\"\"
+
+'stray single-quoted statement'
+b'''bytes, not a comment'''
+r'''raw standalone comment'''
+""",
+    "not docstrings": '''def f(a=(1, 2)):
+    x = 1
+    """after the first statement, so standalone"""
+
+def g():
+    """   """
+
+async def h():
+    """async bodies aren't checked for docstrings"""
+
+class C: pass; """a standalone comment after a semicolon"""
+''',
+}
+
+
+class CommentAgreementTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def extract(self, name, source):
+        path = os.path.join(self.dir, name.replace(" ", "_") + ".py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+        return styleCheck.extract_comments(path), unittestutils.extract_comments(path)
+
+    def testGradersAgree(self):
+        for name, source in SOURCES.items():
+            with self.subTest(name):
+                from_style_check, from_unit_tests = self.extract(name, source)
+                self.assertEqual(from_style_check, from_unit_tests)
+
+    def testHeaderComment(self):
+        inline, docstrings, standalone = self.extract("header", SOURCES["header"])[0]
+        self.assertEqual(inline, [" three lefts make a right"])
+        self.assertEqual(docstrings, ["Harvests a field of beepers.", "Turn 90 degrees clockwise."])
+        self.assertEqual(standalone, ["Your Name\nNetId\nDate"])
+
+    def testOnlyStatementsCount(self):
+        "triple-quoted strings used as values are not comments"
+        inline, docstrings, standalone = self.extract("assigned strings", SOURCES["assigned strings"])[0]
+        self.assertEqual((inline, docstrings, standalone), ([], [], ["a standalone comment"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,70 @@
+import functools
 import random
-import re
-from collections import deque
+
+from _dodecahedron import (
+    ADJACENCY, ALL_MASK, ASCII_MAP, NBR_MASK, ansi_map_renderer, locations_mask, mask_locations,
+    safe_component,
+)
+
+
+# Large-dot map for get_map_ansi
+_ANSI_MAP = r"""
+             ● ● ● ● 18 ● ● ● ●            
+            ●        ●         ●           
+           ●     ● ● 9 ● ●      ●          
+          ●     ●         ●      ●        
+         ●     ●           ●      ●    
+        17     8           10      19       
+        ● ●   ●  ●        ●  ●    ● ●       
+        ●  ● ●    ●      ●    ●  ●  ●    
+        ●   7       1 ● 2      11   ●       
+        ●   ●      ●    ●       ●   ●      
+        ●   6 ● ● 5      3 ● ● 12   ●       
+        ●   ●      ●    ●       ●   ●      
+        ●   ●         4        ●    ●       
+        ●    ●        ●       ●     ●       
+        ●     15 ● ● 14 ● ● 13      ●           
+         ●   ●                ●    ●        
+          ● ●                  ●  ●        
+           16 ● ● ● ● ● ● ● ● ● 20
+        """.rstrip("\n")
+_render_map = ansi_map_renderer(_ANSI_MAP)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_config(haz1, haz2, treasure, map_location, device_location):
+    """
+    Validity check for one placement of objects (hazards given as sorted tuples).
+    Depends only on its arguments, so repeated placements across retries and
+    worlds are answered from the cache.
+    Returns (ok, reason, detail) where detail is the message printed in verbose mode.
+    """
+    hazards = set(haz1) | set(haz2)
+    key_items = {treasure, map_location, device_location}
+
+    if treasure is None or map_location is None or device_location is None:
+        return (False, "Missing key items.", None)
+    if len(set(hazards | key_items)) < len(hazards) + len(key_items):
+        return (False, "Overlapping key items and hazards.", None)
+    if any(item in hazards for item in key_items):
+        return (False, "Key item in hazard.", None)
+
+    safe_mask = ALL_MASK & ~sum(1 << r for r in hazards)
+    key_mask = sum(1 << r for r in key_items)
+
+    # The safe graph is undirected, so every safe location can reach the key items
+    # exactly when one BFS covers all safe locations and the key items.
+    start, visited = safe_component(safe_mask)
+    if visited & key_mask != key_mask:
+        return (False, f"Start location {start} cannot reach all key items.",
+                f"❌ Location {start} cannot reach {key_items - mask_locations(visited)}")
+    if visited != safe_mask:
+        start = min(mask_locations(safe_mask & ~visited))
+        return (False, f"Start location {start} cannot reach all key items.",
+                f"❌ Location {start} cannot reach {key_items}")
+
+    return (True, "OK", f"✅ All safe locations can reach treasure, map, and device.")
+
 
 class AdventureWorld:
     def __init__(self, seed=None, verbose=False):
@@ -31,28 +95,7 @@ class AdventureWorld:
     # ---------- World generation ----------
     def _generate_dodecahedron(self):
         """Generate connections for 20 interlinked locations (each connects to 3 others)."""
-        return {
-            1: [2, 5, 8],
-            2: [1, 3, 10],
-            3: [2, 4, 12],
-            4: [3, 5, 14],
-            5: [1, 4, 6],
-            6: [5, 7, 15],
-            7: [6, 8, 17],
-            8: [1, 7, 9],
-            9: [8, 10, 18],
-            10: [2, 9, 11],
-            11: [10, 12, 19],
-            12: [3, 11, 13],
-            13: [12, 14, 20],
-            14: [4, 13, 15],
-            15: [6, 14, 16],
-            16: [15, 17, 20],
-            17: [7, 16, 18],
-            18: [9, 17, 19],
-            19: [11, 18, 20],
-            20: [13, 16, 19]
-        }
+        return ADJACENCY
 
     def _generate_valid_world(self, base_seed):
         """
@@ -89,66 +132,48 @@ class AdventureWorld:
         locations = list(self.locations.keys())
         self.treasure = self.rng.choice(locations)
 
+        # pool holds the locations still free, kept in location order; removing placed
+        # items from one list (instead of re-filtering or re-sorting) keeps the same
+        # sampling population, and so the same world, for each seed
+        pool = locations
+        pool.remove(self.treasure)
+
         # Hazards
-        self.hazards["type1"] = self.rng.sample([r for r in locations if r != self.treasure], 2)
-        self.hazards["type2"] = self.rng.sample(
-            [r for r in locations if r != self.treasure and r not in self.hazards["type1"]], 2
-        )
+        hazard1 = self.rng.sample(pool, 2)
+        for r in hazard1:
+            pool.remove(r)
+        hazard2 = self.rng.sample(pool, 2)
+        for r in hazard2:
+            pool.remove(r)
+        self.hazards = {"type1": hazard1, "type2": hazard2}
 
         # Tools
-        remaining = [r for r in locations if r not in self.hazards["type1"]
-                     and r not in self.hazards["type2"]
-                     and r != self.treasure]
-        self.map_location, self.device_location = self.rng.sample(remaining, 2)
+        self.map_location, self.device_location = self.rng.sample(pool, 2)
 
     def _validate_world(self, verbose=False):
         """
         Validate that every safe location can reach the treasure, map, and device
         without passing through a hazard.
         """
-        locations = list(self.locations.keys())
-        hazards = set(self.hazards["type1"]) | set(self.hazards["type2"])
-        treasure = self.treasure
-        key_items = {treasure, self.map_location, self.device_location}
-
-        if treasure is None or self.map_location is None or self.device_location is None:
-            return (False, "Missing key items.")
-        if len(set(hazards | key_items)) < len(hazards) + len(key_items):
-            return (False, "Overlapping key items and hazards.")
-        if any(item in hazards for item in key_items):
-            return (False, "Key item in hazard.")
-
-        safe_locations = [r for r in locations if r not in hazards]
-        safe_graph = {r: [n for n in self.locations[r] if n in safe_locations] for r in safe_locations}
-
-        def reachable_from(start):
-            visited = set()
-            q = deque([start])
-            while q:
-                r = q.popleft()
-                visited.add(r)
-                for n in safe_graph[r]:
-                    if n not in visited:
-                        q.append(n)
-            return visited
-
-        for start in safe_locations:
-            visited = reachable_from(start)
-            if not key_items.issubset(visited):
-                if verbose:
-                    print(f"❌ Location {start} cannot reach {key_items - visited}")
-                return (False, f"Start location {start} cannot reach all key items.")
-
-        if verbose:
-            print(f"✅ All safe locations can reach treasure, map, and device.")
-        return (True, "OK")
+        ok, reason, detail = _validate_config(
+            tuple(sorted(self.hazards["type1"])), tuple(sorted(self.hazards["type2"])),
+            self.treasure, self.map_location, self.device_location,
+        )
+        if verbose and detail:
+            print(detail)
+        return (ok, reason)
 
     # ---------- Core World Access ----------
     def get_neighbor_locations(self, location):
-        """Return a list of locations directly connected to the given one."""
+        """Return a tuple of the locations directly connected to the given one."""
         return self.locations[location]
 
     # ---------- Hazards ----------
+    # hazards is a plain dict of lists that callers may replace or append to, so the
+    # masks are built from it on each call rather than kept (and left stale)
+    def _hazard_mask(self, kind):
+        return locations_mask(self.hazards[kind])
+
     def has_hazard1(self, location):
         return location in self.hazards["type1"]
 
@@ -157,11 +182,11 @@ class AdventureWorld:
 
     def neighbor_has_hazard1(self, location):
         """Return True if any neighboring location has a type1 hazard."""
-        return any(n in self.hazards["type1"] for n in self.locations[location])
+        return (self._hazard_mask("type1") & NBR_MASK[location]) != 0
 
     def neighbor_has_hazard2(self, location):
         """Return True if any neighboring location has a type2 hazard."""
-        return any(n in self.hazards["type2"] for n in self.locations[location])
+        return (self._hazard_mask("type2") & NBR_MASK[location]) != 0
 
     # ---------- Treasure ----------
     def has_treasure(self, location):
@@ -198,12 +223,9 @@ class AdventureWorld:
     # ---------- Utility ----------
     def get_unoccupied_locations(self):
         """Return all locations not occupied by a hazard, treasure, map, or device."""
-        occupied = (
-            set(self.hazards["type1"])
-            | set(self.hazards["type2"])
-            | {self.treasure, self.map_location, self.device_location}
-        )
-        return [loc for loc in self.locations if loc not in occupied]
+        occupied = self._hazard_mask("type1") | self._hazard_mask("type2") | locations_mask(
+            (self.treasure, self.map_location, self.device_location))
+        return [loc for loc in self.locations if not (occupied >> loc) & 1]
 
     def set_treasure_location(self, location):
         """
@@ -228,34 +250,14 @@ class AdventureWorld:
         if self.verbose:
             print(f"Treasure moved to location {location}.")
 
-    def get_map_ascii(self):
+    @staticmethod
+    def get_map_ascii():
         """
         Return a fixed ASCII-art map of the 20-location world.
         This version preserves the classic 'Hunt the Wumpus' circular layout
         with proper spacing and connections using slashes and underscores.
         """
-        map_str = r"""
-              ______18______             
-             /      |       \           
-            /      _9__      \          
-           /      /    \      \        
-          /      /      \      \       
-         17     8        10     19       
-         | \   / \      /  \   / |    
-         |  \ /   \    /    \ /  |    
-         |   7     1---2     11  |       
-         |   |    /     \    |   |      
-         |   6----5     3---12   |       
-         |   |     \   /     |   |      
-         |   \       4      /    |      
-         |    \      |     /     |      
-         \     15---14---13     /       
-          \   /            \   /       
-           \ /              \ /        
-            16---------------20
-        
-        """
-        return map_str.strip("\n")
+        return ASCII_MAP
 
 
 
@@ -265,56 +267,7 @@ class AdventureWorld:
         Return a large-dot (●) circular map with ANSI color.
         Dots are faint gray; numbers are bold, bright, and colored.
         """
-
-        base_map = r"""
-             ● ● ● ● 18 ● ● ● ●            
-            ●        ●         ●           
-           ●     ● ● 9 ● ●      ●          
-          ●     ●         ●      ●        
-         ●     ●           ●      ●    
-        17     8           10      19       
-        ● ●   ●  ●        ●  ●    ● ●       
-        ●  ● ●    ●      ●    ●  ●  ●    
-        ●   7       1 ● 2      11   ●       
-        ●   ●      ●    ●       ●   ●      
-        ●   6 ● ● 5      3 ● ● 12   ●       
-        ●   ●      ●    ●       ●   ●      
-        ●   ●         4        ●    ●       
-        ●    ●        ●       ●     ●       
-        ●     15 ● ● 14 ● ● 13      ●           
-         ●   ●                ●    ●        
-          ● ●                  ●  ●        
-           16 ● ● ● ● ● ● ● ● ● 20
-        """.rstrip("\n")
-
-        # ANSI codes
-        ESC = "\x1b"
-        RESET = f"{ESC}[0m"
-        BOLD = f"{ESC}[1m"
-        DIM = f"{ESC}[90m"
-        WHITE = f"{ESC}[97m"
-        BLUE_BG = f"{ESC}[44m"
-
-        color_map = highlights or {}
-
-        # Step 1: Start all text as faint gray
-        styled = f"{DIM}{base_map}{RESET}"
-        #styled = f"{base_map}"
-
-        # Step 2: Replace numbers, keeping dim gray after each reset
-        def style_number(match):
-            num = int(match.group(0))
-            bg = color_map.get(num, BLUE_BG)
-            # temporarily turn off dim, show bold+bright, then return to dim
-            return f"{RESET}{WHITE}{bg}{num}{RESET}{DIM}"
-            #return f"{num}"
-
-        for n in range(20, 0, -1):
-            styled = re.sub(rf"(?<!\d){n}(?!\d)", style_number, styled)
-
-        # Step 3: make sure the map ends cleanly
-        styled += RESET
-        return styled
+        return _render_map(tuple(sorted((highlights or {}).items())))
 
 
     def print_map(self, type="ansi"):
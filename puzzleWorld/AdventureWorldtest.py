@@ -0,0 +1,44 @@
+""" Tests that AdventureWorld's hazard queries follow in-place edits of world.hazards. """
+
+import unittest
+
+from AdventureWorld import AdventureWorld
+
+
+class HazardEditTest(unittest.TestCase):
+
+    def setUp(self):
+        self.world = AdventureWorld(1234)
+        occupied = set(self.world.hazards["type1"]) | set(self.world.hazards["type2"])
+        occupied |= {self.world.treasure, self.world.map_location, self.world.device_location}
+        self.free = [loc for loc in self.world.locations if loc not in occupied]
+
+    def testReplaceHazardList(self):
+        "assigning a new list to hazards['type1'] moves the type1 hazards"
+        old_h1 = self.world.hazards["type1"]
+        new_h1 = self.free[:2]
+        self.world.hazards["type1"] = new_h1
+        for loc in self.world.locations:
+            self.assertEqual(self.world.has_hazard1(loc), loc in new_h1)
+            self.assertEqual(self.world.neighbor_has_hazard1(loc),
+                             any(n in new_h1 for n in self.world.locations[loc]))
+        self.assertTrue(set(old_h1) <= set(self.world.get_unoccupied_locations()))
+
+        self.world.hazards["type1"] = old_h1
+        for loc in old_h1:
+            self.assertTrue(self.world.has_hazard1(loc))
+            self.assertNotIn(loc, self.world.get_unoccupied_locations())
+
+    def testAppendHazard(self):
+        "appending to hazards['type2'] adds a type2 hazard"
+        loc = self.free[0]
+        self.assertFalse(self.world.has_hazard2(loc))
+        self.world.hazards["type2"].append(loc)
+        self.assertTrue(self.world.has_hazard2(loc))
+        for n in self.world.locations[loc]:
+            self.assertTrue(self.world.neighbor_has_hazard2(n))
+        self.assertNotIn(loc, self.world.get_unoccupied_locations())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,179 @@
+import functools
+import os
 import random
-import re
-from collections import deque
+import warnings
+from pathlib import Path
+from types import MappingProxyType
+
+from _dodecahedron import (
+    ADJACENCY, ALL_MASK, ASCII_MAP, NBR_MASK, ansi_map_renderer, locations_mask, mask_locations,
+    safe_component,
+)
+
+
+# Large-dot map for get_map_ansi
+_ANSI_MAP = r"""
+             ● ● ● ● 18 ● ● ● ●            
+            ●                  ●           
+           ●     ● ● 9 ● ●      ●          
+          ●     ●         ●      ●        
+         ●     ●           ●      ●    
+        17     8           10      19       
+        ● ●   ●  ●        ●  ●    ● ●       
+        ●  ● ●    ●      ●    ●  ●  ●    
+        ●   7       1 ● 2      11   ●       
+        ●   ●      ●    ●       ●   ●      
+        ●   6 ● ● 5      3 ● ● 12   ●       
+        ●   ●      ●    ●       ●   ●      
+        ●   ●         4        ●    ●       
+        ●    ●        ●       ●     ●       
+        ●     15 ● ● 14 ● ● 13      ●           
+         ●   ●                ●    ●        
+          ● ●                  ●  ●        
+           16 ● ● ● ● ● ● ● ● ● 20
+        """.rstrip("\n")
+_render_map = ansi_map_renderer(_ANSI_MAP)
+
+
+# Layout of PuzzleWorld.__str__; word_puzzle is its two lines (with newlines) or empty
+_STATE_TEMPLATE = (
+    "=== PuzzleWorld State ===\n"
+    "Treasure location:       {treasure}\n"
+    "Hazard Type 1 locations: {hazard1}\n"
+    "Hazard Type 2 locations: {hazard2}\n"
+    "Puzzle locations:        {puzzles}\n"
+    "---First word puzzle ----\n"
+    "{word_puzzle}"
+    "---First number puzzle ----\n"
+    "Number puzzle question: {number_question}\n"
+    "Number puzzle answer:   {number_answer}\n"
+    "=========================="
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_words_cached(filename, mtime):
+    """
+    Read the whitespace-separated words from a file. Shared by every PuzzleWorld;
+    mtime is only part of the cache key, so an edited file is read again.
+    """
+    return tuple(Path(filename).read_text(encoding="utf-8").split())
+
+
+@functools.lru_cache(maxsize=1024)
+def _letter_signature(word):
+    """
+    Letter counts of word (case-insensitive) as a 26-tuple for a-z, plus any other
+    characters sorted. Two words have the same signature exactly when they are anagrams.
+    """
+    counts = [0] * 26
+    others = []
+    for ch in word.lower():
+        i = ord(ch) - 97
+        if 0 <= i < 26:
+            counts[i] += 1
+        else:
+            others.append(ch)
+    return tuple(counts), "".join(sorted(others))
+
+
+@functools.lru_cache(maxsize=128)
+def _prepare_puzzles_for_seed(seed, words):
+    """
+    Build the word and number puzzles for a seed, using their own random.Random(seed)
+    so they don't depend on (or disturb) world placement. Cached, so worlds with the
+    same seed and words share one copy, so everything returned is immutable
+    (tuples, bytes and read-only mappings): no world can change another's puzzles.
+    Returns (word order, word scrambles, number puzzles).
+    """
+    rng = random.Random(seed)
+
+    # ---- Word puzzles ----
+    # Only index permutations are stored; questions are built when asked for.
+    # Shuffling indices makes the same swaps as shuffling the words/letters
+    # themselves, so each seed keeps its puzzle sequence.
+    shuffle = rng.shuffle
+    order = list(range(len(words)))
+    shuffle(order)
+    word_scrambles = []
+    for i in order:
+        perm = list(range(len(words[i])))
+        shuffle(perm)
+        word_scrambles.append(bytes(perm))  # immutable, one byte per letter
+
+    # ---- Number puzzles ----
+    num_number_puzzles=100
+    number_puzzles = []
+    choice, randint = rng.choice, rng.randint  # bound once for the loop
+    pattern_types = ("arithmetic", "geometric")
+    for _ in range(num_number_puzzles):
+        pattern_type = choice(pattern_types)
+        start = randint(1, 9)
+        step = randint(2, 5)
+
+        # five terms at once: the first four are shown, the fifth is the answer
+        if pattern_type == "arithmetic":
+            terms = [str(start + i * step) for i in range(5)]
+        else:
+            terms = [str(start * step ** i) for i in range(5)]
+        answer = terms.pop()
+
+        question = f"What number comes next? {', '.join(terms)}, ..."
+        number_puzzles.append(MappingProxyType({
+            "type": "number",
+            "question": question,
+            "answer": answer
+        }))
+
+    return tuple(order), tuple(word_scrambles), tuple(number_puzzles)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_config(haz1, haz2, puzzles, treasure):
+    """
+    Validity check for one placement of objects (hazards and puzzles given as sorted
+    tuples). Depends only on its arguments, so repeated placements across retries and
+    worlds are answered from the cache.
+    Returns (ok, reason, detail) where detail is the message printed in verbose mode.
+    """
+    hazards = set(haz1) | set(haz2)
+    puzzles = set(puzzles)
+
+    # === Basic checks ===
+    if treasure is None:
+        return (False, "Treasure not set.", None)
+    if not puzzles or len(puzzles) < 2:
+        return (False, "Missing puzzle locations.", None)
+    if len(set(hazards | puzzles | {treasure})) < len(hazards) + len(puzzles) + 1:
+        return (False, "Overlapping treasure/puzzles/hazards.", None)
+
+    # === No key items in hazards ===
+    if treasure in hazards:
+        return (False, f"Treasure in hazard {treasure}", None)
+    for p in puzzles:
+        if p in hazards:
+            return (False, f"Puzzle location {p} in hazard", None)
+
+    # === Build safe graph (as a bitmask of safe locations) ===
+    safe_mask = ALL_MASK & ~sum(1 << r for r in hazards)
+
+    # === Test all safe locations ===
+    # The safe graph is undirected, so every safe location can reach the objectives
+    # exactly when one BFS covers all safe locations and the objectives.
+    needed = puzzles | {treasure}
+    needed_mask = sum(1 << r for r in needed)
+    start, visited = safe_component(safe_mask)
+    if visited & needed_mask != needed_mask:
+        return (False, f"Start location {start} cannot reach all objectives",
+                f"❌ location {start} cannot reach {needed - mask_locations(visited)}")
+    if visited != safe_mask:
+        start = min(mask_locations(safe_mask & ~visited))
+        return (False, f"Start location {start} cannot reach all objectives",
+                f"❌ location {start} cannot reach {needed}")
+
+    return (True, "OK",
+            f"✅ All {safe_mask.bit_count()} safe locations can reach puzzles {puzzles} and treasure {treasure}")
+
 
 class PuzzleWorld:
     def __init__(self, seed=None, verbose=False):
@@ -24,17 +197,15 @@ class PuzzleWorld:
         self.puzzles = []
         self.treasure = None
 
-        # puzzle handling
+        # puzzle handling; the puzzles themselves are prepared on first use, from the
+        # seed as given (the world may still bump self.seed below)
         self.word_list = self._load_words("words.txt")
-        self.word_puzzle_sequence = []
+        self._puzzle_seed = self.seed
+        self._prepared_puzzles = None
+        self._number_puzzles = None
         self.word_puzzle_index = 0
-
-        self.number_puzzle_sequence = []
         self.number_puzzle_index = 0
 
-
-        self._prepare_puzzles()
-
         # generate a valid world, bumping seed if necessary
         self.seed = self._generate_valid_world(self.seed)
         if self.verbose:
@@ -42,28 +213,7 @@ class PuzzleWorld:
 
     # ---------- World generation ----------
     def _generate_dodecahedron(self):
-        return {
-            1: [2, 5, 8],
-            2: [1, 3, 10],
-            3: [2, 4, 12],
-            4: [3, 5, 14],
-            5: [1, 4, 6],
-            6: [5, 7, 15],
-            7: [6, 8, 17],
-            8: [1, 7, 9],
-            9: [8, 10, 18],
-            10: [2, 9, 11],
-            11: [10, 12, 19],
-            12: [3, 11, 13],
-            13: [12, 14, 20],
-            14: [4, 13, 15],
-            15: [6, 14, 16],
-            16: [15, 17, 20],
-            17: [7, 16, 18],
-            18: [9, 17, 19],
-            19: [11, 18, 20],
-            20: [13, 16, 19]
-        }
+        return ADJACENCY
 
     def _generate_valid_world(self, base_seed):
         """
@@ -102,13 +252,20 @@ class PuzzleWorld:
 
         locations = list(self.locations.keys())
         self.treasure = self.rng.choice(locations)
-        self.hazards["type1"] = self.rng.sample([r for r in locations if r != self.treasure], 2)
-        self.hazards["type2"] = self.rng.sample(
-            [r for r in locations if r != self.treasure and r not in self.hazards["type1"]], 2
-        )
-        self.puzzles = self.rng.sample(
-            [r for r in locations if r != self.treasure and r not in self.hazards["type1"] and r not in self.hazards["type2"]], 2
-        )
+
+        # pool holds the locations still free, kept in location order; removing placed
+        # items from one list (instead of re-filtering or re-sorting) keeps the same
+        # sampling population, and so the same world, for each seed
+        pool = locations
+        pool.remove(self.treasure)
+        hazard1 = self.rng.sample(pool, 2)
+        for r in hazard1:
+            pool.remove(r)
+        hazard2 = self.rng.sample(pool, 2)
+        for r in hazard2:
+            pool.remove(r)
+        self.hazards = {"type1": hazard1, "type2": hazard2}
+        self.puzzles = self.rng.sample(pool, 2)
 
     def _validate_world(self, verbose=False):
         """
@@ -116,142 +273,105 @@ class PuzzleWorld:
         Ensures every non-hazard (safe) location can reach both puzzle locations and the treasure
         without passing through a hazard.
         """
-
-        locations = list(self.locations.keys())
-        hazards = set(self.hazards.get("type1", [])) | set(self.hazards.get("type2", []))
-        puzzles = set(getattr(self, "puzzles", []))
-        treasure = getattr(self, "treasure", None)
-
-        # === Basic checks ===
-        if treasure is None:
-            return (False, "Treasure not set.")
-        if not puzzles or len(puzzles) < 2:
-            return (False, "Missing puzzle locations.")
-        if len(set(hazards | puzzles | {treasure})) < len(hazards) + len(puzzles) + 1:
-            return (False, "Overlapping treasure/puzzles/hazards.")
-
-        # === No key items in hazards ===
-        if treasure in hazards:
-            return (False, f"Treasure in hazard {treasure}")
-        for p in puzzles:
-            if p in hazards:
-                return (False, f"Puzzle location {p} in hazard")
-
-        # === Build safe graph ===
-        safe_locations = [r for r in locations if r not in hazards]
-        safe_graph = {r: [n for n in self.locations[r] if n in safe_locations] for r in safe_locations}
-
-        # === Helper BFS ===
-        def reachable_from(start):
-            visited = set()
-            q = deque([start])
-            while q:
-                r = q.popleft()
-                visited.add(r)
-                for n in safe_graph[r]:
-                    if n not in visited:
-                        q.append(n)
-            return visited
-
-        # === Test all safe locations ===
-        for start in safe_locations:
-            visited = reachable_from(start)
-            needed = puzzles | {treasure}
-            if not needed.issubset(visited):
-                if verbose:
-                    print(f"❌ location {start} cannot reach {needed - visited}")
-                return (False, f"Start location {start} cannot reach all objectives")
-
-        if verbose:
-            print(f"✅ All {len(safe_locations)} safe locations can reach puzzles {puzzles} and treasure {treasure}")
-
-        return (True, "OK")
+        ok, reason, detail = _validate_config(
+            tuple(sorted(self.hazards.get("type1", []))), tuple(sorted(self.hazards.get("type2", []))),
+            tuple(sorted(getattr(self, "puzzles", []))), getattr(self, "treasure", None),
+        )
+        if verbose and detail:
+            print(detail)
+        return (ok, reason)
 
 
 
     # ---------- Puzzle preparation ----------
     def _load_words(self, filename):
-        """Read words from a file, strip whitespace, ignore empties."""
-        with open(filename, "r") as f:
-            return [line.strip() for line in f if line.strip()]
+        """Return the words in a file as a tuple, reading the file only if it changed."""
+        # key on the absolute path so a relative name can't hit another directory's entry
+        path = os.path.abspath(filename)
+        return _load_words_cached(path, os.stat(path).st_mtime_ns)
 
     def _prepare_puzzles(self):
         """Precompute both word and number puzzles so they have a deterministic sequence based on world's random seed."""
+        if self._prepared_puzzles is None:
+            self._prepared_puzzles = _prepare_puzzles_for_seed(self._puzzle_seed, self.word_list)
+        return self._prepared_puzzles
+
+    @property
+    def _word_order(self):
+        """word_list index of each word puzzle, in puzzle order."""
+        return self._prepare_puzzles()[0]
+
+    @property
+    def _word_scrambles(self):
+        """Letter order of each word puzzle's scrambled word."""
+        return self._prepare_puzzles()[1]
+
+    @property
+    def word_puzzle_sequence(self):
+        """
+        Deprecated: use get_next_word_puzzle(). The word puzzles, in order, as dicts with
+        'type', 'question' and 'answer', built from the stored permutations on each
+        access; editing the returned list does not change the puzzles the world serves.
+        """
+        warnings.warn("PuzzleWorld.word_puzzle_sequence is deprecated; use get_next_word_puzzle()",
+                      DeprecationWarning, stacklevel=2)
+        return [{"type": "word", "question": question, "answer": answer}
+                for question, answer in map(self._word_puzzle, range(len(self._word_order)))]
+
+    @property
+    def number_puzzle_sequence(self):
+        """
+        The number puzzles, in order, as a list of dicts with 'type', 'question' and
+        'answer'. Copied from the shared (read-only) puzzles on first use, so each
+        world has its own list to change.
+        """
+        if self._number_puzzles is None:
+            self._number_puzzles = [dict(p) for p in self._prepare_puzzles()[2]]
+        return self._number_puzzles
+
+    @number_puzzle_sequence.setter
+    def number_puzzle_sequence(self, puzzles):
+        self._number_puzzles = puzzles
+
+    def _scrambled_word(self, index):
+        """Return the scrambled word of word puzzle number index."""
+        w = self.word_list[self._word_order[index]]
+        return "".join(map(w.__getitem__, self._word_scrambles[index]))
 
-        # ---- Word puzzles ----
-        words = self.word_list[:]
-        self.rng.shuffle(words)
-        self.word_puzzle_sequence = []
-        for w in words:
-            scrambled = list(w)
-            self.rng.shuffle(scrambled)
-            self.word_puzzle_sequence.append({
-                "type": "word",
-                "question": f"Unscramble this word: {''.join(scrambled)}",
-                "answer": w.lower()
-            })
-
-        # ---- Number puzzles ----
-        num_number_puzzles=100
-        self.number_puzzle_sequence = []
-        for _ in range(num_number_puzzles):
-            pattern_type = self.rng.choice(["arithmetic", "geometric"])
-            start = self.rng.randint(1, 9)
-            step = self.rng.randint(2, 5)
-
-            if pattern_type == "arithmetic":
-                seq = [start + i * step for i in range(4)]
-                answer = str(start + 4 * step)
-            else:
-                seq = [start * (step ** i) for i in range(4)]
-                answer = str(start * (step ** 4))
-
-            question = f"What number comes next? {', '.join(map(str, seq))}, ..."
-            self.number_puzzle_sequence.append({
-                "type": "number",
-                "question": question,
-                "answer": answer
-            })
+    def _answer(self, index):
+        """Return the (lowercase) answer to word puzzle number index."""
+        return self.word_list[self._word_order[index]].lower()
 
+    def _word_puzzle(self, index):
+        """Return word puzzle number index as [question, answer]."""
+        return [f"Unscramble this word: {self._scrambled_word(index)}", self._answer(index)]
 
     def __str__(self):
         """
         Return a readable summary of the world state for debugging or testing.
         """
-        lines = []
-        lines.append("=== PuzzleWorld State ===")
-        lines.append(f"Treasure location:       {self.treasure}")
-        lines.append(f"Hazard Type 1 locations: {self.hazards['type1']}")
-        lines.append(f"Hazard Type 2 locations: {self.hazards['type2']}")
-        lines.append(f"Puzzle locations:        {self.puzzles}")
-
-        # --- Word puzzle info ---
-        #lines.append(f"Current word puzzle index: {self.puzzle_index}")
-        lines.append("---First word puzzle ----")
-        if self.word_puzzle_sequence:
-            p = self.word_puzzle_sequence[self.word_puzzle_index]
-            lines.append(f"Word puzzle question: {p['question']}")
-            lines.append(f"Word puzzle answer:   {p['answer']}")
-
-
-        # --- Number puzzle info ---
-        # lines.append(f"Current number puzzle index: {self.number_puzzle_index}")
-        lines.append("---First number puzzle ----")
+        word_puzzle = ""
+        if self._word_order:
+            question, answer = self._word_puzzle(self.word_puzzle_index)
+            word_puzzle = f"Word puzzle question: {question}\nWord puzzle answer:   {answer}\n"
         p = self.number_puzzle_sequence[self.number_puzzle_index]
-        lines.append(f"Number puzzle question: {p['question']}")
-        lines.append(f"Number puzzle answer:   {p['answer']}")
-
-
-        lines.append("==========================")
-        return "\n".join(lines)
+        return _STATE_TEMPLATE.format(
+            treasure=self.treasure,
+            hazard1=self.hazards["type1"],
+            hazard2=self.hazards["type2"],
+            puzzles=self.puzzles,
+            word_puzzle=word_puzzle,
+            number_question=p["question"],
+            number_answer=p["answer"],
+        )
 
     # ---------- Public methods  ----------
 
     def get_next_word_puzzle(self):
         """Return the next word puzzle as a list [question, answer]."""
-        p = self.word_puzzle_sequence[self.word_puzzle_index]
-        self.word_puzzle_index = (self.word_puzzle_index + 1) % len(self.word_puzzle_sequence)  # keep in range
-        return [p["question"], p["answer"]]
+        p = self._word_puzzle(self.word_puzzle_index)
+        self.word_puzzle_index = (self.word_puzzle_index + 1) % len(self._word_order)  # keep in range
+        return p
 
 
     def get_next_number_puzzle(self):
@@ -260,34 +380,14 @@ class PuzzleWorld:
         self.number_puzzle_index = (self.number_puzzle_index+1)  % len(self.number_puzzle_sequence)
         return [p["question"], p["answer"]]
 
-    def get_map_ascii(self):
+    @staticmethod
+    def get_map_ascii():
         """
         Return a fixed ASCII-art map of the 20-location world.
         This version preserves the classic 'Hunt the Wumpus' circular layout
         with proper spacing and connections using slashes and underscores.
         """
-        map_str = r"""
-              ______18______             
-             /      |       \           
-            /      _9__      \          
-           /      /    \      \        
-          /      /      \      \       
-         17     8        10     19       
-         | \   / \      /  \   / |    
-         |  \ /   \    /    \ /  |    
-         |   7     1---2     11  |       
-         |   |    /     \    |   |      
-         |   6----5     3---12   |       
-         |   |     \   /     |   |      
-         |   \       4      /    |      
-         |    \      |     /     |      
-         \     15---14---13     /       
-          \   /            \   /       
-           \ /              \ /        
-            16---------------20
-        
-        """
-        return map_str.strip("\n")
+        return ASCII_MAP
 
 
 
@@ -297,56 +397,7 @@ class PuzzleWorld:
         Return a large-dot (●) circular map with ANSI color.
         Dots are faint gray; numbers are bold, bright, and colored.
         """
-
-        base_map = r"""
-             ● ● ● ● 18 ● ● ● ●            
-            ●                  ●           
-           ●     ● ● 9 ● ●      ●          
-          ●     ●         ●      ●        
-         ●     ●           ●      ●    
-        17     8           10      19       
-        ● ●   ●  ●        ●  ●    ● ●       
-        ●  ● ●    ●      ●    ●  ●  ●    
-        ●   7       1 ● 2      11   ●       
-        ●   ●      ●    ●       ●   ●      
-        ●   6 ● ● 5      3 ● ● 12   ●       
-        ●   ●      ●    ●       ●   ●      
-        ●   ●         4        ●    ●       
-        ●    ●        ●       ●     ●       
-        ●     15 ● ● 14 ● ● 13      ●           
-         ●   ●                ●    ●        
-          ● ●                  ●  ●        
-           16 ● ● ● ● ● ● ● ● ● 20
-        """.rstrip("\n")
-
-        # ANSI codes
-        ESC = "\x1b"
-        RESET = f"{ESC}[0m"
-        BOLD = f"{ESC}[1m"
-        DIM = f"{ESC}[90m"
-        WHITE = f"{ESC}[97m"
-        BLUE_BG = f"{ESC}[44m"
-
-        color_map = highlights or {}
-
-        # Step 1: Start all text as faint gray
-        styled = f"{DIM}{base_map}{RESET}"
-        #styled = f"{base_map}"
-
-        # Step 2: Replace numbers, keeping dim gray after each reset
-        def style_number(match):
-            num = int(match.group(0))
-            bg = color_map.get(num, BLUE_BG)
-            # temporarily turn off dim, show bold+bright, then return to dim
-            return f"{RESET}{WHITE}{bg}{num}{RESET}{DIM}"
-            #return f"{num}"
-
-        for n in range(20, 0, -1):
-            styled = re.sub(rf"(?<!\d){n}(?!\d)", style_number, styled)
-
-        # Step 3: make sure the map ends cleanly
-        styled += RESET
-        return styled
+        return _render_map(tuple(sorted((highlights or {}).items())))
 
 
     def print_map(self, type="ansi"):
@@ -364,9 +415,11 @@ class PuzzleWorld:
  
     # ---------- Hazard/Treasure/Puzzle getters ----------
     def get_adjacent_locations(self, location):
-        """Return a list of locations adjacent to the given one"""
+        """Return a tuple of the locations adjacent to the given one"""
         return self.locations[location]
 
+    # hazards and puzzles are plain lists that callers may replace or append to, so the
+    # masks behind is_*_adjacent are built from them on each call rather than kept
     def has_hazard1(self, location):
         """Return true if given location has a type1 hazard in it. 
            Equivalent to: 'if location in get_hazard1_locations()' """
@@ -391,11 +444,11 @@ class PuzzleWorld:
 
     def is_hazard1_adjacent(self, location):
         """Return True if any connected location has a hazard of type 1."""
-        return any(neighbor in self.hazards["type1"] for neighbor in self.locations[location])
+        return (locations_mask(self.hazards["type1"]) & NBR_MASK[location]) != 0
 
     def is_hazard2_adjacent(self, location):
         """Return True if any connected location has a hazard of type 2."""
-        return any(neighbor in self.hazards["type2"] for neighbor in self.locations[location])
+        return (locations_mask(self.hazards["type2"]) & NBR_MASK[location]) != 0
 
     def get_treasure_location(self):
         """Return the location number of the treasure"""
@@ -415,7 +468,7 @@ class PuzzleWorld:
 
     def is_puzzle_adjacent(self, location):
         """Return True if any connected location has a puzzle."""
-        return any(neighbor in self.hazards["type2"] for neighbor in self.locations[location])
+        return (locations_mask(self.puzzles) & NBR_MASK[location]) != 0
 
     def get_puzzle_locations(self):
         """Return a list of locations that have a puzzle"""
@@ -426,7 +479,8 @@ class PuzzleWorld:
         Return a list of all locations in the world that are not occupied 
         by a hazard, puzzle, or the treasure.
         """
-        occupied = set(self.hazards["type1"]) | set(self.hazards["type2"]) | set(self.puzzles) | {self.treasure}
+        occupied = {self.treasure}
+        occupied.update(self.hazards["type1"], self.hazards["type2"], self.puzzles)
         return [loc for loc in self.locations if loc not in occupied]
 
 
@@ -436,20 +490,65 @@ class PuzzleWorld:
         Raises a ValueError if the location is occupied by a hazard or puzzle.
         Suggests using get_unoccupied_locations() to find safe locations.
         """
-        if (location in self.hazards["type1"] or 
-            location in self.hazards["type2"] or 
+        if location not in self.locations:
+            raise ValueError(f"Invalid location number: {location}")
+        if (location in self.hazards["type1"] or
+            location in self.hazards["type2"] or
             location in self.puzzles):
             raise ValueError(
                 f"Location {location} is occupied by a hazard or puzzle. "
                 f"Use get_unoccupied_locations() to find a safe location."
             )
-        if location not in self.locations:
-            raise ValueError(f"Invalid location number: {location}")
         
         self.treasure = location
         if self.verbose:
             print(f"Treasure moved to location {location}.")
 
+    # ---------- Room-based names (used by model_game.py) ----------
+    @property
+    def rooms(self):
+        """Same as locations: each room number mapped to its adjacent rooms."""
+        return self.locations
+
+    def get_adjacent_rooms(self, room):
+        """Same as get_adjacent_locations."""
+        return self.get_adjacent_locations(room)
+
+    def is_treasure(self, room):
+        """Same as has_treasure."""
+        return self.has_treasure(room)
+
+    def get_treasure_room(self):
+        """Same as get_treasure_location."""
+        return self.get_treasure_location()
+
+    def relocate_treasure(self):
+        """
+        Move the treasure to a random unoccupied room, leaving hazards, puzzles and the
+        puzzle sequence as they are. Returns the new room.
+        """
+        self.treasure = self.rng.choice(self.get_unoccupied_locations())
+        return self.treasure
+
+    def get_puzzle(self):
+        """Return the scrambled word of the current word puzzle."""
+        return self._scrambled_word(self.word_puzzle_index)
+
+    def check_solution(self, guess):
+        """Return True if guess unscrambles the current word puzzle (case-insensitive)."""
+        return guess.strip().lower() == self._answer(self.word_puzzle_index)
+
+    def is_anagram(self, guess):
+        """
+        Return True if guess uses exactly the letters of the current word puzzle, in any
+        order (case-insensitive). Useful for telling a wrong unscramble from a typo.
+        """
+        return _letter_signature(guess.strip()) == _letter_signature(self._answer(self.word_puzzle_index))
+
+    def generate_new_puzzle(self):
+        """Move on to the next word puzzle."""
+        self.word_puzzle_index = (self.word_puzzle_index + 1) % len(self._word_order)
+
 
 
 if __name__ =="__main__":
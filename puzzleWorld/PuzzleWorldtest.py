@@ -0,0 +1,43 @@
+""" Tests that PuzzleWorld's location queries follow in-place edits of hazards and puzzles. """
+
+import unittest
+
+from PuzzleWorld import PuzzleWorld
+
+
+class PlacementEditTest(unittest.TestCase):
+
+    def setUp(self):
+        self.world = PuzzleWorld(1121)
+        self.free = self.world.get_unoccupied_locations()
+
+    def testReplaceHazardList(self):
+        "assigning a new list to hazards['type1'] moves the type1 hazards"
+        old_h1 = self.world.hazards["type1"]
+        new_h1 = self.free[:2]
+        self.world.hazards["type1"] = new_h1
+        for loc in self.world.locations:
+            self.assertEqual(self.world.has_hazard1(loc), loc in new_h1)
+            self.assertEqual(self.world.is_hazard1_adjacent(loc),
+                             any(n in new_h1 for n in self.world.locations[loc]))
+        self.assertEqual(self.world.get_hazard1_locations(), new_h1)
+
+        self.world.hazards["type1"] = old_h1
+        for loc in old_h1:
+            self.assertTrue(self.world.has_hazard1(loc))
+            self.assertRaises(ValueError, self.world.set_treasure_location, loc)
+
+    def testAppendPuzzle(self):
+        "appending to puzzles adds a puzzle location"
+        loc = self.free[0]
+        self.assertFalse(self.world.has_puzzle(loc))
+        self.world.puzzles.append(loc)
+        self.assertTrue(self.world.has_puzzle(loc))
+        for n in self.world.locations[loc]:
+            self.assertTrue(self.world.is_puzzle_adjacent(n))
+        self.assertNotIn(loc, self.world.get_unoccupied_locations())
+        self.assertRaises(ValueError, self.world.set_treasure_location, loc)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Pieces shared by AdventureWorld and PuzzleWorld: the fixed 20-location dodecahedron,
+bitmask helpers for sets of locations, and the map drawings.
+"""
+import functools
+import re
+from types import MappingProxyType
+
+# Connections for the 20 interlinked locations of a dodecahedron (each connects to 3 others).
+# Shared by every world, so it is read-only: a world can't change another world's map.
+ADJACENCY = MappingProxyType({
+    1: (2, 5, 8),
+    2: (1, 3, 10),
+    3: (2, 4, 12),
+    4: (3, 5, 14),
+    5: (1, 4, 6),
+    6: (5, 7, 15),
+    7: (6, 8, 17),
+    8: (1, 7, 9),
+    9: (8, 10, 18),
+    10: (2, 9, 11),
+    11: (10, 12, 19),
+    12: (3, 11, 13),
+    13: (12, 14, 20),
+    14: (4, 13, 15),
+    15: (6, 14, 16),
+    16: (15, 17, 20),
+    17: (7, 16, 18),
+    18: (9, 17, 19),
+    19: (11, 18, 20),
+    20: (13, 16, 19),
+})
+
+# bit n of a mask is set when location n is in the set; NBR_MASK[loc] holds loc's neighbors
+NBR_MASK = {loc: sum(1 << n for n in nbrs) for loc, nbrs in ADJACENCY.items()}
+ALL_MASK = sum(1 << loc for loc in ADJACENCY)
+
+
+def locations_mask(locations):
+    """Return the mask with the bit of each given location set."""
+    mask = 0
+    for loc in locations:
+        if loc not in ADJACENCY:
+            raise ValueError(f"Invalid location number: {loc}")
+        mask |= 1 << int(loc)
+    return mask
+
+
+def has_location(mask, location):
+    """
+    Return True if location's bit is set in mask. As with `location in some_list`,
+    anything that isn't a location number (None, a negative number, a string) is
+    simply not found instead of raising.
+    """
+    if type(location) is int:
+        return location >= 0 and (mask >> location) & 1 == 1
+    # rare: values such as 3.0 or True still compare equal to a location number
+    return any(location == loc for loc in mask_locations(mask))
+
+
+def reachable_mask(safe_mask, start):
+    """
+    BFS over location bitmasks: return the mask of locations reachable from start
+    moving only through locations in safe_mask.
+    """
+    visited = frontier = 1 << start
+    while frontier:
+        reached = 0
+        while frontier:
+            low = frontier & -frontier         # lowest set bit = next location to expand
+            reached |= NBR_MASK[low.bit_length() - 1]
+            frontier ^= low
+        frontier = reached & safe_mask & ~visited
+        visited |= frontier
+    return visited
+
+
+def mask_locations(mask):
+    """Return the set of location numbers whose bits are set in mask."""
+    return {loc for loc in range(mask.bit_length()) if (mask >> loc) & 1}
+
+
+@functools.lru_cache(maxsize=8192)
+def safe_component(safe_mask):
+    """
+    Return (start, reachable mask) for a BFS from the lowest location in safe_mask.
+    Connectivity depends only on where the hazards are, so one result serves every
+    placement of the treasure and other objects around the same hazards.
+    """
+    start = (safe_mask & -safe_mask).bit_length() - 1
+    return start, reachable_mask(safe_mask, start)
+
+
+# Fixed ASCII map of the 20 locations; built once since it never changes
+ASCII_MAP = r"""
+              ______18______             
+             /      |       \           
+            /      _9__      \          
+           /      /    \      \        
+          /      /      \      \       
+         17     8        10     19       
+         | \   / \      /  \   / |    
+         |  \ /   \    /    \ /  |    
+         |   7     1---2     11  |       
+         |   |    /     \    |   |      
+         |   6----5     3---12   |       
+         |   |     \   /     |   |      
+         |   \       4      /    |      
+         |    \      |     /     |      
+         \     15---14---13     /       
+          \   /            \   /       
+           \ /              \ /        
+            16---------------20
+        
+        """.strip("\n")
+
+# ANSI codes used for the large-dot map
+_ESC = "\x1b"
+_RESET = f"{_ESC}[0m"
+_DIM = f"{_ESC}[90m"
+_WHITE = f"{_ESC}[97m"
+_BLUE_BG = f"{_ESC}[44m"
+
+# a number on the ANSI map; \d+ is greedy, so "18" is never split into "1" and "8"
+_NUM_RE = re.compile(r"\d+")
+
+
+def _style_num(num, bg):
+    """A location number that turns off dim, shows bright on background bg, then returns to dim."""
+    return f"{_RESET}{_WHITE}{bg}{num}{_RESET}{_DIM}"
+
+
+# every location number in its default (blue background) style
+_STYLED_NUM = {num: _style_num(num, _BLUE_BG) for num in range(1, 21)}
+
+
+def ansi_map_renderer(base_map):
+    """
+    Return a function that draws base_map with ANSI colors. The map is split around its
+    location numbers once, here; the returned function takes a sorted tuple of
+    (location, background code) pairs and caches the map drawn for each.
+    """
+    segments = []
+    pos = 0
+    for match in _NUM_RE.finditer(base_map):
+        num = int(match.group(0))
+        if 1 <= num <= 20:
+            segments.append((base_map[pos:match.start()], num))
+            pos = match.end()
+    tail = base_map[pos:]
+
+    @functools.lru_cache(maxsize=64)
+    def render(highlight_items):
+        # only highlighted numbers need a new styled string; the rest come from the table
+        styled = dict(_STYLED_NUM)
+        styled.update((num, _style_num(num, bg)) for num, bg in highlight_items)
+
+        # Fixed text is faint gray; each number is styled as in _style_num
+        parts = [_DIM]
+        for text, num in segments:
+            parts.append(text)
+            parts.append(styled[num])
+        parts.append(tail)
+
+        # make sure the map ends cleanly
+        parts.append(_RESET + _RESET)
+        return "".join(parts)
+
+    return render
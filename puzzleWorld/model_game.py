@@ -36,6 +36,9 @@ SEED = 42                 # Change or set to None for non-deterministic runs
 STABILITY_TURNS = 6       # How many moves you have (after reveal) before the treasure relocates
 ALLOW_DEVICE_FROM_ADJ = False  # If True, allow capturing from an adjacent room (not default)
 
+# One random generator for the whole game, so every hazard-2 toss picks a fresh room
+game_rng = random.Random(SEED)
+
 # ------------------------------
 # Helper functions
 # ------------------------------
@@ -43,8 +46,7 @@ ALLOW_DEVICE_FROM_ADJ = False  # If True, allow capturing from an adjacent room
 def choose_start_room(world: PuzzleWorld) -> int:
     """Pick a starting room that isn't immediately deadly (avoid spawning on hazard1)."""
     rooms = list(world.rooms.keys())
-    rng = random.Random(SEED)  # keep consistent with the run
-    rng.shuffle(rooms)
+    game_rng.shuffle(rooms)
     for r in rooms:
         if not world.has_hazard1(r):  # type1 is instant-loss
             return r
@@ -129,14 +131,13 @@ def handle_room_entry(world: PuzzleWorld, room: int) -> tuple[int, bool, str]:
         return room, False, "You stumble into Hazard 1… game over!"
     if world.has_hazard2(room):
         # 'Bats' effect: whisk to random room that's not instantly deadly if possible
-        rng = random.Random(SEED)
         all_rooms = list(world.rooms.keys())
-        rng.shuffle(all_rooms)
+        game_rng.shuffle(all_rooms)
         for r in all_rooms:
             if not world.has_hazard1(r):
                 return r, True, "Hazard 2 tosses you through the tunnels!"
         # Fallback
-        return random.choice(all_rooms), True, "Hazard 2 tosses you through the tunnels!"
+        return game_rng.choice(all_rooms), True, "Hazard 2 tosses you through the tunnels!"
     return room, True, ""
 
 def solve_puzzle(world: PuzzleWorld) -> bool:
@@ -184,13 +185,8 @@ def use_device(world: PuzzleWorld, player_room: int, revealed_room: int | None,
             return False, True, "The device fizzles—your intel is stale. The treasure has moved."
     else:
         # Wrong room: device consumed, treasure teleports
-        # (We’ll re-generate the world’s treasure placement only, keeping hazards the same
-        # to keep the game readable. Simplest: call generate_world() then restore hazards.)
-        old_h1 = world.hazards["type1"][:]
-        old_h2 = world.hazards["type2"][:]
-        world.generate_world()
-        world.hazards["type1"] = old_h1
-        world.hazards["type2"] = old_h2
+        # (Only the treasure moves; hazards and puzzles stay put to keep the game readable.)
+        world.relocate_treasure()
         return False, True, "Wrong room! The device discharges and the treasure relocates."
 
 # ------------------------------
@@ -216,11 +212,7 @@ def main():
         if revealed_room is not None and steps_since_reveal is not None:
             if steps_since_reveal >= STABILITY_TURNS:
                 # Treasure relocates (reveal info becomes stale)
-                old_h1 = world.hazards["type1"][:]
-                old_h2 = world.hazards["type2"][:]
-                world.generate_world()
-                world.hazards["type1"] = old_h1
-                world.hazards["type2"] = old_h2
+                world.relocate_treasure()
                 print("\n*** Too slow! The treasure has shifted to a new room. ***")
                 revealed_room = None
                 steps_since_reveal = None
@@ -23,9 +23,10 @@ def print_movie_list(heading, movie_list):
     🪄 Tip: Use a for-loop with range(len(movie_list)) to print
     each movie on its own line with a number starting from 1.
     """
-    print(heading)
+    lines = [heading]
     for i in range(len(movie_list)):
-        print(f"{i + 1}. {movie_list[i]}")
+        lines.append(f"{i + 1}. {movie_list[i]}")
+    print("\n".join(lines))  # one print for the whole list instead of one per movie
 
 
 def print_full_movie_info(title):
@@ -45,14 +46,15 @@ def print_full_movie_info(title):
     """
     global all_titles, all_ratings, all_description, all_directors, all_actors
 
+    search = title.lower()  # lower the search text once, not once per movie
     found = False
     for i in range(len(all_titles)):
-        if title.lower() in all_titles[i].lower():
-            print(f"\nTitle: {all_titles[i]}")
-            print(f"Rating: {all_ratings[i]}")
-            print(f"Director: {all_directors[i]}")
-            print(f"Actors: {all_actors[i]}")
-            print(f"Description: {all_description[i]}")
+        if search in all_titles[i].lower():
+            print(f"\nTitle: {all_titles[i]}\n"
+                  f"Rating: {all_ratings[i]}\n"
+                  f"Director: {all_directors[i]}\n"
+                  f"Actors: {all_actors[i]}\n"
+                  f"Description: {all_description[i]}")
             found = True
     if not found:
         print("No matching movie found.")
@@ -118,9 +120,10 @@ def movies_by_director(name):
     """
     global all_titles, all_directors
 
+    search = name.lower()
     result = []
     for i in range(len(all_directors)):
-        if name.lower() in all_directors[i].lower():
+        if search in all_directors[i].lower():
             result.append(all_titles[i])
     return result
 
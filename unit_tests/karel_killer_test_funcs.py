@@ -15,24 +15,34 @@ post-condition: returns true if and only if the two lists have exactly
 one element that differs."""
 def exactlyOneDiff(before_list, after_list):
     diff_count = 0
-    for i in range(len(before_list)):
-        if before_list[i]!= after_list[i]:
+    for before, after in zip(before_list, after_list):
+        if before != after:
             diff_count+=1
+            if diff_count > 1:  # a second difference already decides it
+                return False
     return diff_count == 1
 
 
 import importlib
+import sys
 
-def globalVarsExist(module_name="main", required_global_vars=[]):
-    try:
-        module = importlib.import_module(module_name)  # Dynamically import the module
-    except ModuleNotFoundError:
-        print(f"Error: Module '{module_name}' not found.")
-        return False
+# the game's global variables, as the tests expect them to be spelled
+REQUIRED_GLOBAL_VARS = ["clues_needed", "clues_found", "days_remaining", "misinformation_chance"]
+
+def globalVarsExist(module_name="main", required_global_vars=None):
+    module = sys.modules.get(module_name)  # already imported by an earlier test
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)  # Dynamically import the module
+        except ModuleNotFoundError:
+            print(f"Error: Module '{module_name}' not found.")
+            return False
   
-    required_global_vars = ["clues_needed", "clues_found", "days_remaining", "misinformation_chance"]
+    if not required_global_vars:
+        required_global_vars = REQUIRED_GLOBAL_VARS
+    module_vars = vars(module)
     for var in required_global_vars:
-        if not hasattr(module,var):
+        if var not in module_vars:
             print("The tests require these global variables to be in place (spelled the same):")
             print(required_global_vars)
             print("You are missing:",var)